@@ -220,20 +220,21 @@ class KagentMemoryService(BaseMemoryService):
                 logger.error("Response body: %s", response.text)
             response.raise_for_status()
             results = response.json()
-
-            memories = []
-            for item in results:
-                content = types.Content(
-                    role="user",
-                    parts=[types.Part(text=item.get("content", ""))],
-                )
-                memory_entry = MemoryEntry(id=item.get("id"), content=content)
-                memories.append(memory_entry)
-
-            if len(memories) == 0:
+            if not results:
                 logger.warning("No memories found for query: %s", query)
                 return SearchMemoryResponse(memories=[])
 
+            memories = [
+                MemoryEntry(
+                    id=item.get("id"),
+                    content=types.Content(
+                        role="user",
+                        parts=[types.Part(text=item.get("content", ""))],
+                    ),
+                )
+                for item in results
+            ]
+
             logger.info("Successfully retrieved memories for query: %s", query)
             return SearchMemoryResponse(memories=memories)
         except Exception as e:
@@ -256,44 +257,59 @@ class KagentMemoryService(BaseMemoryService):
 
         for event in session.events or []:
             if event.content and event.content.parts:
-                for part in event.content.parts:
-                    # Skip tool calls and executable code requests
-                    if hasattr(part, "function_call") and part.function_call:
-                        continue
-                    if hasattr(part, "executable_code") and part.executable_code:
-                        continue
-
-                    role = event.author or "unknown"
-                    text_content = None
-
-                    # Prefer existing text if available
-                    if hasattr(part, "text") and part.text:
-                        text_content = part.text
-
-                    # Fallback: Extract content from tool responses if text is missing
-                    elif hasattr(part, "function_response") and part.function_response:
-                        try:
-                            # Attempt to serialize the response payload
-                            response_data = getattr(part.function_response, "response", None)
-                            if response_data:
-                                text_content = json.dumps(response_data, default=str)
-                        except Exception:
-                            logger.warning("Failed to serialize function_response payload", exc_info=True)
-
-                    elif hasattr(part, "code_execution_result") and part.code_execution_result:
-                        try:
-                            # Typically has 'output' field
-                            output = getattr(part.code_execution_result, "output", None)
-                            if output:
-                                text_content = output
-                        except Exception:
-                            logger.warning("Failed to extract code_execution_result output", exc_info=True)
-
-                    if text_content:
-                        parts.append(f"{role}: {text_content}")
+                # Every part of an event shares the same author prefix.
+                role = event.author or "unknown"
+                parts.extend(
+                    f"{role}: {text_content}"
+                    for part in event.content.parts
+                    if (text_content := self._extract_part_text(part))
+                )
 
         return "\n".join(parts)
 
+    @staticmethod
+    def _extract_part_text(part: types.Part) -> Optional[str]:
+        """Extract the text of a single event part.
+
+        Args:
+            part: The event part to extract text from
+
+        Returns:
+            The part's text, serialized tool output or code execution output, or None for
+            tool calls, executable code and parts without content
+        """
+        # Skip tool calls and executable code requests
+        if hasattr(part, "function_call") and part.function_call:
+            return None
+        if hasattr(part, "executable_code") and part.executable_code:
+            return None
+
+        # Prefer existing text if available
+        if hasattr(part, "text") and part.text:
+            return part.text
+
+        # Fallback: Extract content from tool responses if text is missing
+        if hasattr(part, "function_response") and part.function_response:
+            try:
+                # Attempt to serialize the response payload
+                response_data = getattr(part.function_response, "response", None)
+                if response_data:
+                    return json.dumps(response_data, default=str)
+            except Exception:
+                logger.warning("Failed to serialize function_response payload", exc_info=True)
+            return None
+
+        if hasattr(part, "code_execution_result") and part.code_execution_result:
+            try:
+                # Typically has 'output' field
+                output = getattr(part.code_execution_result, "output", None)
+                if output:
+                    return output
+            except Exception:
+                logger.warning("Failed to extract code_execution_result output", exc_info=True)
+
+        return None
+
     async def _summarize_session_content_async(
         self,
         content: str,
@@ -388,7 +388,7 @@ class KAgentBedrockLlm(KAgentTLSMixin, BaseLlm):
                 loop.run_in_executor(None, _produce)
 
                 aggregated_text = ""
-                tool_uses: dict[str, dict] = {}  # toolUseId -> {name, input_json}
+                tool_uses: dict[str, dict] = {}  # toolUseId -> {name, input_chunks}
                 current_tool_id: Optional[str] = None
                 stop_reason = "end_turn"
                 usage_metadata: Optional[types.GenerateContentResponseUsageMetadata] = None
@@ -403,7 +403,7 @@ class KAgentBedrockLlm(KAgentTLSMixin, BaseLlm):
                             sanitized = start["toolUse"]["name"]
                             tool_uses[current_tool_id] = {
                                 "name": reverse_name_map.get(sanitized, sanitized),
-                                "input_json": "",
+                                "input_chunks": [],
                             }
 
                     elif "contentBlockDelta" in event:
@@ -416,7 +416,7 @@ class KAgentBedrockLlm(KAgentTLSMixin, BaseLlm):
                                 turn_complete=False,
                             )
                         elif "toolUse" in delta and current_tool_id:
-                            tool_uses[current_tool_id]["input_json"] += delta["toolUse"].get("input", "")
+                            tool_uses[current_tool_id]["input_chunks"].append(delta["toolUse"].get("input", ""))
 
                     elif "messageStop" in event:
                         stop_reason = event["messageStop"].get("stopReason", "end_turn")
@@ -434,7 +434,8 @@ class KAgentBedrockLlm(KAgentTLSMixin, BaseLlm):
                 if aggregated_text:
                     final_parts.append(types.Part.from_text(text=aggregated_text))
                 for tool_id, tool in tool_uses.items():
-                    args = json.loads(tool["input_json"]) if tool["input_json"] else {}
+                    input_json = "".join(tool["input_chunks"])
+                    args = json.loads(input_json) if input_json else {}
                     part = types.Part.from_function_call(name=tool["name"], args=args)
                     if part.function_call:
                         part.function_call.id = tool_id
@@ -470,7 +470,8 @@ class BaseOpenAI(KAgentTLSMixin, BaseLlm):
                 aggregated_text = ""
                 finish_reason = None
                 usage_metadata = None
-                # Accumulate tool calls - keyed by index since they arrive in chunks
+                # Accumulate tool calls - keyed by index since they arrive in chunks. Argument deltas are
+                # collected in a list and joined once, as += on a dict value copies the string every time.
                 tool_calls_acc: dict[int, dict[str, Any]] = {}
 
                 # Request usage metadata in streaming mode (OpenAI API feature since Nov 2023)
@@ -497,7 +498,7 @@ class BaseOpenAI(KAgentTLSMixin, BaseLlm):
                                     tool_calls_acc[idx] = {
                                         "id": "",
                                         "name": "",
-                                        "arguments": "",
+                                        "arguments": [],
                                         "thought_signature": None,
                                     }
                                 # Accumulate the chunks
@@ -507,7 +508,7 @@ class BaseOpenAI(KAgentTLSMixin, BaseLlm):
                                     if tool_call_chunk.function.name:
                                         tool_calls_acc[idx]["name"] = tool_call_chunk.function.name
                                     if tool_call_chunk.function.arguments:
-                                        tool_calls_acc[idx]["arguments"] += tool_call_chunk.function.arguments
+                                        tool_calls_acc[idx]["arguments"].append(tool_call_chunk.function.arguments)
                                 thought_signature = _extract_thought_signature(
                                     getattr(tool_call_chunk, "model_extra", {}).get("extra_content")
                                 )
@@ -534,8 +535,9 @@ class BaseOpenAI(KAgentTLSMixin, BaseLlm):
                 # Add accumulated tool calls
                 for idx in sorted(tool_calls_acc.keys()):
                     tc = tool_calls_acc[idx]
+                    arguments = "".join(tc["arguments"])
                     try:
-                        args = json.loads(tc["arguments"]) if tc["arguments"] else {}
+                        args = json.loads(arguments) if arguments else {}
                     except json.JSONDecodeError:
                         args = {}
 
@@ -403,14 +403,14 @@ class KAgentSAPAICoreLlm(BaseLlm):
                         for tc in delta["tool_calls"]:
                             idx = tc.get("index", 0)
                             if idx not in tool_calls_acc:
-                                tool_calls_acc[idx] = {"id": "", "name": "", "arguments": ""}
+                                tool_calls_acc[idx] = {"id": "", "name": "", "arguments": []}
                             if tc.get("id"):
                                 tool_calls_acc[idx]["id"] = tc["id"]
                             func = tc.get("function", {})
                             if func.get("name"):
                                 tool_calls_acc[idx]["name"] = func["name"]
                             if func.get("arguments"):
-                                tool_calls_acc[idx]["arguments"] += func["arguments"]
+                                tool_calls_acc[idx]["arguments"].append(func["arguments"])
 
                     if choice.get("finish_reason"):
                         finish_reason_str = choice["finish_reason"]
@@ -428,8 +428,9 @@ class KAgentSAPAICoreLlm(BaseLlm):
             final_parts.append(types.Part.from_text(text=aggregated_text))
         for idx in sorted(tool_calls_acc.keys()):
             tc = tool_calls_acc[idx]
+            arguments = "".join(tc["arguments"])
             try:
-                args = json.loads(tc["arguments"]) if tc["arguments"] else {}
+                args = json.loads(arguments) if arguments else {}
             except json.JSONDecodeError:
                 args = {}
             part = types.Part.from_function_call(name=tc["name"], args=args)
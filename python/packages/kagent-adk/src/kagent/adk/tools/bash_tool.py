@@ -69,7 +69,7 @@ class BashTool(BaseTool):
                 working_dir,
                 self.skills_directory,
             )
-            logger.info(f"Executed bash command: {command}, description: {description}")
+            logger.info("Executed bash command: %s, description: %s", command, description)
             return result
         except Exception as e:
             error_msg = f"Error executing command '{command}': {e}"
@@ -72,8 +72,9 @@ class SkillsTool(BaseTool):
     def _invoke_skill(self, skill_name: str) -> str:
         """Load and return the full content of a skill."""
         # Check cache first
-        if skill_name in self._skill_cache:
-            return self._skill_cache[skill_name]
+        cached = self._skill_cache.get(skill_name)
+        if cached is not None:
+            return cached
 
         try:
             content = load_skill_content(self.skills_directory, skill_name)
@@ -35,7 +35,7 @@ class TestEmbeddingClient:
         vec = [0.1] * 768
         mock_response = make_openai_embedding_response([vec])
         with mock.patch("openai.AsyncOpenAI") as mock_cls:
-            instance = mock.AsyncMock()
+            instance = mock.MagicMock()
             instance.embeddings.create = mock.AsyncMock(return_value=mock_response)
             mock_cls.return_value = instance
             result = await client.generate("hello world")
@@ -47,7 +47,7 @@ class TestEmbeddingClient:
         vecs = [[0.1] * 768, [0.2] * 768]
         mock_response = make_openai_embedding_response(vecs)
         with mock.patch("openai.AsyncOpenAI") as mock_cls:
-            instance = mock.AsyncMock()
+            instance = mock.MagicMock()
             instance.embeddings.create = mock.AsyncMock(return_value=mock_response)
             mock_cls.return_value = instance
             result = await client.generate(["hello", "world"])
@@ -75,7 +75,7 @@ class TestEmbeddingDispatch:
         vec = [0.1] * 768
         mock_response = make_openai_embedding_response([vec])
         with mock.patch("openai.AsyncOpenAI") as mock_cls:
-            instance = mock.AsyncMock()
+            instance = mock.MagicMock()
             instance.embeddings.create = mock.AsyncMock(return_value=mock_response)
             mock_cls.return_value = instance
             result = await client.generate("hello world")
@@ -95,7 +95,7 @@ class TestEmbeddingDispatch:
             ),
             mock.patch("openai.AsyncAzureOpenAI") as mock_cls,
         ):
-            instance = mock.AsyncMock()
+            instance = mock.MagicMock()
             instance.embeddings.create = mock.AsyncMock(return_value=mock_response)
             mock_cls.return_value = instance
             result = await client.generate("hello")
@@ -108,7 +108,7 @@ class TestEmbeddingDispatch:
         vecs = [[0.1] * 768]
         mock_result = mock.MagicMock()
         mock_result.embeddings = vecs
-        mock_client = mock.AsyncMock()
+        mock_client = mock.MagicMock()
         mock_client.embed = mock.AsyncMock(return_value=mock_result)
 
         with mock.patch("ollama.AsyncClient") as mock_cls:
@@ -123,7 +123,7 @@ class TestEmbeddingDispatch:
         client = make_client(provider="ollama", model="nomic-embed-text", base_url="http://custom-ollama:11434")
         mock_result = mock.MagicMock()
         mock_result.embeddings = [[0.0] * 768]
-        mock_client = mock.AsyncMock()
+        mock_client = mock.MagicMock()
         mock_client.embed = mock.AsyncMock(return_value=mock_result)
 
         with mock.patch("ollama.AsyncClient") as mock_cls:
@@ -137,7 +137,7 @@ class TestEmbeddingDispatch:
         long_vec = [1.0] * 1000
         mock_response = make_openai_embedding_response([long_vec])
         with mock.patch("openai.AsyncOpenAI") as mock_cls:
-            instance = mock.AsyncMock()
+            instance = mock.MagicMock()
             instance.embeddings.create = mock.AsyncMock(return_value=mock_response)
             mock_cls.return_value = instance
             result = await client.generate("test")
@@ -150,7 +150,7 @@ class TestEmbeddingDispatch:
         vec = [0.1] * 768
         mock_response = make_openai_embedding_response([vec])
         with mock.patch("openai.AsyncOpenAI") as mock_cls:
-            instance = mock.AsyncMock()
+            instance = mock.MagicMock()
             instance.embeddings.create = mock.AsyncMock(return_value=mock_response)
             mock_cls.return_value = instance
             result = await client.generate("test")
@@ -160,7 +160,7 @@ class TestEmbeddingDispatch:
     async def test_provider_error_returns_empty_list(self):
         client = make_client(provider="openai", model="text-embedding-3-small")
         with mock.patch("openai.AsyncOpenAI") as mock_cls:
-            instance = mock.AsyncMock()
+            instance = mock.MagicMock()
             instance.embeddings.create = mock.AsyncMock(side_effect=Exception("API error"))
             mock_cls.return_value = instance
             result = await client.generate("test")
@@ -172,7 +172,7 @@ class TestEmbeddingDispatch:
         short_vec = [0.1] * 64
         mock_response = make_openai_embedding_response([short_vec])
         with mock.patch("openai.AsyncOpenAI") as mock_cls:
-            instance = mock.AsyncMock()
+            instance = mock.MagicMock()
             instance.embeddings.create = mock.AsyncMock(return_value=mock_response)
             mock_cls.return_value = instance
             result = await client.generate("test")
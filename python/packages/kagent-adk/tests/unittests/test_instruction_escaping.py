@@ -6,7 +6,6 @@ bypasses placeholder processing entirely. See:
 https://github.com/kagent-dev/kagent/issues/1382
 """
 
-import asyncio
 import sys
 from unittest.mock import MagicMock
 
@@ -105,7 +104,8 @@ class TestStaticInstructionBypass:
     KeyError on {repo}-style placeholders.
     """
 
-    def test_inject_session_state_raises_on_unresolved_variable(self):
+    @pytest.mark.asyncio
+    async def test_inject_session_state_raises_on_unresolved_variable(self):
         """inject_session_state raises KeyError for {repo} when state is empty.
 
         This is the original bug: ADK's state injection treats {repo} as a
@@ -117,9 +117,10 @@ class TestStaticInstructionBypass:
         mock_ctx = MagicMock()
         mock_ctx._invocation_context.session.state = {}
         with pytest.raises(KeyError, match="repo"):
-            asyncio.run(inject_session_state("Clone {repo}", mock_ctx))
+            await inject_session_state("Clone {repo}", mock_ctx)
 
-    def test_raw_string_instruction_would_not_bypass(self):
+    @pytest.mark.asyncio
+    async def test_raw_string_instruction_would_not_bypass(self):
         """A raw string in the instruction field would set bypass_state_injection=False.
 
         This proves the fix is necessary: without static_instruction, ADK
@@ -131,6 +132,6 @@ class TestStaticInstructionBypass:
         # Temporarily set instruction to a raw string to verify ADK behavior
         agent.instruction = "Raw string with {repo}"
         mock_ctx = MagicMock()
-        text, bypass = asyncio.run(agent.canonical_instruction(mock_ctx))
+        text, bypass = await agent.canonical_instruction(mock_ctx)
         assert bypass is False, "raw string in instruction must set bypass_state_injection=False"
         assert text == "Raw string with {repo}"
@@ -1,4 +1,3 @@
-import asyncio
 from types import SimpleNamespace
 
 import pytest
@@ -340,7 +339,8 @@ def test_post_response_flush_skips_excluded_paths(monkeypatch):
     assert calls == [True]
 
 
-def test_post_response_flush_precedes_terminal_body(monkeypatch):
+@pytest.mark.asyncio
+async def test_post_response_flush_precedes_terminal_body(monkeypatch):
     from fastapi import FastAPI
 
     events = []
@@ -358,12 +358,13 @@ def test_post_response_flush_precedes_terminal_body(monkeypatch):
     async def send(message):
         events.append(message["type"])
 
-    asyncio.run(app.build_middleware_stack()({"type": "http", "path": "/"}, None, send))
+    await app.build_middleware_stack()({"type": "http", "path": "/"}, None, send)
 
     assert events == ["http.response.start", "server-span-ended", "flushed", "http.response.body"]
 
 
-def test_post_response_flush_sends_terminal_body_when_app_raises(monkeypatch):
+@pytest.mark.asyncio
+async def test_post_response_flush_sends_terminal_body_when_app_raises(monkeypatch):
     # An exception raised after the app produced its terminal body must not
     # swallow that body: the middleware holds it back for the flush, so it is
     # responsible for forwarding it even on the error path. The exception
@@ -386,7 +387,7 @@ def test_post_response_flush_sends_terminal_body_when_app_raises(monkeypatch):
         events.append(message["type"])
 
     with pytest.raises(RuntimeError, match="post-response instrumentation failure"):
-        asyncio.run(app.build_middleware_stack()({"type": "http", "path": "/"}, None, send))
+        await app.build_middleware_stack()({"type": "http", "path": "/"}, None, send)
 
     assert events == ["http.response.start", "flushed", "http.response.body"]
 
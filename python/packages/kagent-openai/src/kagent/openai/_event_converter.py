@@ -66,6 +66,13 @@ def convert_openai_event_to_a2a_events(
     Returns:
         List of A2A events (may be empty if event doesn't need conversion)
     """
+    # RawResponsesStreamEvent (raw LLM responses) arrives once per token delta and is never
+    # converted, so it is skipped before any other work. The lazy log avoids formatting the
+    # event payload when debug logging is off.
+    if isinstance(event, RawResponsesStreamEvent):
+        logger.debug("Raw response event: %s", event.data)
+        return []
+
     a2a_events: list[A2AEvent] = []
 
     try:
@@ -73,11 +80,6 @@ def convert_openai_event_to_a2a_events(
         if isinstance(event, RunItemStreamEvent):
             a2a_events.extend(_convert_run_item_event(event, task_id, context_id, app_name))
 
-        # Handle RawResponsesStreamEvent (raw LLM responses)
-        elif isinstance(event, RawResponsesStreamEvent):
-            # These are low-level events - can be logged but not converted
-            logger.debug(f"Raw response event: {event.data}")
-
         # Other event types
         else:
             logger.debug(f"Unhandled event type: {type(event).__name__}")
@@ -106,30 +108,15 @@ def _convert_run_item_event(
     Returns:
         List containing A2A events based on the item type
     """
-    # Handle message output
-    if isinstance(event.item, MessageOutputItem):
-        return _convert_message_output(event.item, task_id, context_id, app_name)
-
-    # Handle tool calls
-    elif isinstance(event.item, ToolCallItem):
-        return _convert_tool_call(event.item, task_id, context_id, app_name)
-
-    # Handle tool outputs
-    elif isinstance(event.item, ToolCallOutputItem):
-        return _convert_tool_output(event.item, task_id, context_id, app_name)
-
-    # Handle handoff calls (map to subagent-style function_call for the UI)
-    elif isinstance(event.item, HandoffCallItem):
-        return _convert_handoff_call(event.item, task_id, context_id, app_name)
-
-    # Handle handoff outputs (map to subagent-style function_response)
-    elif isinstance(event.item, HandoffOutputItem):
-        return _convert_handoff_output(event.item, task_id, context_id, app_name)
-
-    # Other item types
-    else:
-        logger.debug(f"Unhandled run item type: {type(event.item).__name__}")
+    item = event.item
+    converter = _RUN_ITEM_CONVERTERS.get(type(item))
+    if converter is None:
+        # Subclasses of the known item types miss the exact-type lookup
+        converter = next((conv for cls, conv in _RUN_ITEM_CONVERTERS.items() if isinstance(item, cls)), None)
+    if converter is None:
+        logger.debug("Unhandled run item type: %s", type(item).__name__)
         return []
+    return converter(item, task_id, context_id, app_name)
 
 
 def _convert_message_output(
@@ -409,3 +396,14 @@ def _convert_handoff_output(
     )
 
     return [_artifact_event(message, task_id, context_id)]
+
+
+# Run item type -> converter, so each run item is dispatched with one dict lookup.
+# Handoff calls and outputs map to subagent-style function_call/function_response for the UI.
+_RUN_ITEM_CONVERTERS = {
+    MessageOutputItem: _convert_message_output,
+    ToolCallItem: _convert_tool_call,
+    ToolCallOutputItem: _convert_tool_output,
+    HandoffCallItem: _convert_handoff_call,
+    HandoffOutputItem: _convert_handoff_output,
+}
@@ -1,3 +1,12 @@
-from ._tools import bash, edit_file, get_skill_tool, get_skill_tools, read_file, write_file
+from ._tools import bash, edit_file, edit_file_batch, get_skill_tool, get_skill_tools, read_file, read_files, write_file
 
-__all__ = ["edit_file", "write_file", "read_file", "bash", "get_skill_tool", "get_skill_tools"]
+__all__ = [
+    "edit_file",
+    "edit_file_batch",
+    "write_file",
+    "read_file",
+    "read_files",
+    "bash",
+    "get_skill_tool",
+    "get_skill_tools",
+]
@@ -14,18 +14,23 @@ from agents.exceptions import UserError
 from agents.run_context import RunContextWrapper
 from agents.tool import FunctionTool, function_tool
 from kagent.skills import (
+    FileEdit,
     discover_skills,
+    edit_file_batch_content,
     edit_file_content,
     execute_command,
     generate_skills_tool_description,
     get_bash_description,
+    get_edit_file_batch_description,
     get_edit_file_description,
     get_read_file_description,
+    get_read_files_description,
     get_session_path,
     get_write_file_description,
     initialize_session_path,
     load_skill_content,
     read_file_content,
+    read_files_content,
     write_file_content,
 )
 
@@ -35,6 +40,10 @@ logger = logging.getLogger(__name__)
 
 _skills_directory = os.getenv("KAGENT_SKILLS_FOLDER", "/skills")
 
+# Building a FunctionTool inspects the signature and generates its JSON schema, so the skill tool
+# of each resolved skills directory is reused, and replaced once its description changes.
+_skill_tool_cache: dict[Path, tuple[str, FunctionTool]] = {}
+
 # --- System Tools ---
 
 
@@ -63,6 +72,26 @@ def read_file(
         raise UserError(str(e)) from e
 
 
+@function_tool(
+    name_override="read_files",
+    description_override=get_read_files_description(),
+)
+def read_files(wrapper: RunContextWrapper[SessionContext], file_paths: list[str]) -> str:
+    """Read several files from the filesystem concurrently."""
+    try:
+        session_id = wrapper.context.session_id
+        working_dir = get_session_path(session_id)
+        paths = [Path(file_path) for file_path in file_paths]
+        paths = [path if path.is_absolute() else working_dir / path for path in paths]
+
+        allowed_dirs = [working_dir, Path(_skills_directory)]
+
+        results = read_files_content(paths, allowed_root=allowed_dirs)
+        return "\n\n".join(f"==> {file_path} <==\n{results[str(path)]}" for file_path, path in zip(file_paths, paths))
+    except (ValueError, OSError) as e:
+        raise UserError(str(e)) from e
+
+
 @function_tool(
     name_override="write_file",
     description_override=get_write_file_description(),
@@ -105,6 +134,24 @@ def edit_file(
         raise UserError(str(e)) from e
 
 
+@function_tool(
+    name_override="edit_file_batch",
+    description_override=get_edit_file_batch_description(),
+)
+def edit_file_batch(wrapper: RunContextWrapper[SessionContext], file_path: str, edits: list[FileEdit]) -> str:
+    """Apply several exact string replacements to a file in one read/write cycle."""
+    try:
+        session_id = wrapper.context.session_id
+        working_dir = get_session_path(session_id)
+        path = Path(file_path)
+        if not path.is_absolute():
+            path = working_dir / path
+
+        return edit_file_batch_content(path, edits, allowed_root=working_dir)
+    except (FileNotFoundError, IsADirectoryError, ValueError, OSError) as e:
+        raise UserError(str(e)) from e
+
+
 @function_tool(
     name_override="bash",
     description_override=get_bash_description(),
@@ -131,11 +178,16 @@ def get_skill_tool(skills_directory: str | Path = "/skills") -> FunctionTool:
     skills_dir = Path(skills_directory)
     if not skills_dir.exists():
         raise ValueError(f"Skills directory does not exist: {skills_dir}")
+    skills_dir = skills_dir.resolve()
 
     # Discover skills and generate the tool description.
     skills = discover_skills(skills_dir)
     description = generate_skills_tool_description(skills)
 
+    cached = _skill_tool_cache.get(skills_dir)
+    if cached is not None and cached[0] == description:
+        return cached[1]
+
     @function_tool(name_override="skills", description_override=description)
     def skill_tool_impl(wrapper: RunContextWrapper[SessionContext], command: str) -> str:
         """Execute a skill by name.
@@ -156,7 +208,7 @@ def get_skill_tool(skills_directory: str | Path = "/skills") -> FunctionTool:
             # Mimic ADK's formatting
             header = (
                 f'<command-message>The "{skill_name}" skill is loading</command-message>\n\n'
-                f"Base directory for this skill: {skills_dir.resolve()}/{skill_name}\n\n"
+                f"Base directory for this skill: {skills_dir}/{skill_name}\n\n"
             )
             footer = (
                 "\n\n---\n"
@@ -169,6 +221,7 @@ def get_skill_tool(skills_directory: str | Path = "/skills") -> FunctionTool:
         except Exception as e:
             return f"An unexpected error occurred while loading skill '{skill_name}': {e}"
 
+    _skill_tool_cache[skills_dir] = (description, skill_tool_impl)
     return skill_tool_impl
 
 
@@ -180,6 +233,7 @@ def get_skill_tools(skills_directory: str | Path = "/skills") -> list[FunctionTo
         skills_directory: Path to the directory containing skills.
 
     Returns:
-        A list of FunctionTool instances: skills tool, read_file, write_file, edit_file, and bash
+        A list of FunctionTool instances: skills tool, read_file, read_files, write_file, edit_file,
+        edit_file_batch, and bash
     """
-    return [get_skill_tool(skills_directory), read_file, write_file, edit_file, bash]
+    return [get_skill_tool(skills_directory), read_file, read_files, write_file, edit_file, edit_file_batch, bash]
@@ -1,10 +1,12 @@
 from .discovery import discover_skills, load_skill_content
-from .models import Skill
+from .models import FileEdit, Skill
 from .prompts import (
     generate_skills_tool_description,
     get_bash_description,
+    get_edit_file_batch_description,
     get_edit_file_description,
     get_read_file_description,
+    get_read_files_description,
     get_write_file_description,
 )
 from .session import (
@@ -13,9 +15,11 @@ from .session import (
     initialize_session_path,
 )
 from .shell import (
+    edit_file_batch_content,
     edit_file_content,
     execute_command,
     read_file_content,
+    read_files_content,
     write_file_content,
 )
 
@@ -23,14 +27,19 @@ __all__ = [
     "discover_skills",
     "load_skill_content",
     "Skill",
+    "FileEdit",
     "read_file_content",
+    "read_files_content",
     "write_file_content",
     "edit_file_content",
+    "edit_file_batch_content",
     "execute_command",
     "generate_skills_tool_description",
     "get_read_file_description",
+    "get_read_files_description",
     "get_write_file_description",
     "get_edit_file_description",
+    "get_edit_file_batch_description",
     "get_bash_description",
     "initialize_session_path",
     "get_session_path",
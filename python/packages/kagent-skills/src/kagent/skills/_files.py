@@ -0,0 +1,27 @@
+"""Low-level file reading shared by the skills modules."""
+
+from __future__ import annotations
+
+import os
+
+# Size of the reads that follow the first one, for files that grew after they were stat'ed.
+_READ_SIZE = 128 * 1024
+
+# Files larger than this are read with a sequential readahead hint.
+_SEQUENTIAL_READ_THRESHOLD = 1024 * 1024
+
+
+def load_bytes(path: str, size: int) -> bytes:
+    """Read a whole file through a raw file descriptor, given its size from a prior stat."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        # Large files are read front to back in one go; let the kernel use aggressive readahead.
+        if size > _SEQUENTIAL_READ_THRESHOLD and hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        # The first read is sized from the stat; later reads only happen if the file grew.
+        chunks = []
+        while chunk := os.read(fd, size + 1 if not chunks else _READ_SIZE):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
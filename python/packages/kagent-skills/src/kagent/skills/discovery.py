@@ -1,80 +1,245 @@
 from __future__ import annotations
 
+import functools
 import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import yaml
-
+from ._files import load_bytes
 from .models import Skill
 
 logger = logging.getLogger(__name__)
 
 
-def parse_skill_metadata(skill_file: Path) -> dict[str, str] | None:
-    """Parse YAML frontmatter from a SKILL.md file."""
-    try:
-        with open(skill_file, encoding="utf-8") as f:
-            content = f.read()
+# Matches the leading "---" delimited YAML block of a SKILL.md file. The closing delimiter
+# must be on its own line, so "---" inside a value does not end the frontmatter early.
+_FRONTMATTER_PATTERN = re.compile(r"\A---[ \t]*\r?\n(.*?)\r?\n[ \t]*---[ \t]*(?:\r?\n|\Z)", re.DOTALL | re.ASCII)
 
-        if not content.startswith("---"):
-            return None
+# The closing delimiter line of a frontmatter block, as searched for while reading a SKILL.md.
+_FRONTMATTER_CLOSE_PATTERN = re.compile(rb"\n[ \t]*---[ \t]*\r?\n")
+
+# Discovery reads and parses changed SKILL.md files on a thread pool once there are this many.
+_PARALLEL_THRESHOLD = 4
+
+# SKILL.md files are read in blocks of this size until the end of the frontmatter is found.
+_FRONTMATTER_READ_SIZE = 4096
+
+# Parse results of SKILL.md files keyed by path, with the (mtime_ns, size) they were parsed at.
+# Repeat discovery only stats each file and re-parses the ones that changed.
+_skill_metadata_cache: dict[str, tuple[tuple[int, int], Skill | Exception | None]] = {}
+
+# SKILL.md paths of each skills directory's subdirectories, keyed by directory with its mtime_ns.
+_skill_dirs_cache: dict[str, tuple[int, list[Path]]] = {}
+
+
+# A plain "key: value" line whose key needs no quoting in YAML.
+_SIMPLE_KEY_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*", re.ASCII)
+
+# Leading characters that give a YAML value a meaning other than a plain string: indicators,
+# flow collections, anchors, tags, block scalars, comments, and the start of numbers or null.
+_SPECIAL_VALUE_START = frozenset("-?:,[]{}#&*!|>%@`+.0123456789~")
+
+# Plain values that YAML resolves to booleans, null or the "=" and "<<" special tags rather than strings.
+_NON_STRING_WORDS = frozenset({"true", "false", "yes", "no", "on", "off", "y", "n", "null", "=", "<<"})
 
-        parts = content.split("---", 2)
-        if len(parts) < 3:
+
+def _scan_flat_mapping(block: str) -> dict[str, str] | None:
+    """Parse frontmatter made only of single-line "key: string" pairs, the usual SKILL.md shape.
+
+    Returns None for anything else (nesting, block or flow values, escapes, comments, non-string
+    scalars) so that the caller can fall back to a full YAML parser with identical results.
+    """
+    mapping: dict[str, str] = {}
+    for line in block.split("\n"):
+        line = line.removesuffix("\r")
+        if not line.isprintable():
+            return None
+        if not line.strip() or line.startswith("#"):
+            continue
+        key, sep, value = line.partition(":")
+        if not sep or not _SIMPLE_KEY_PATTERN.fullmatch(key):
+            return None
+        if value and not value[0].isspace():
+            return None
+        value = value.strip()
+        if not value:
+            return None
+        if value[0] in "\"'":
+            inner = value[1:-1]
+            if len(value) < 2 or value[-1] != value[0] or value[0] in inner or "\\" in inner:
+                return None
+            value = inner
+        elif (
+            value[0] in _SPECIAL_VALUE_START
+            or value.lower() in _NON_STRING_WORDS
+            or ": " in value
+            or value.endswith(":")
+            or " #" in value
+        ):
             return None
+        mapping[key] = value
+    return mapping
 
-        metadata = yaml.safe_load(parts[1])
-        if isinstance(metadata, dict) and "name" in metadata and "description" in metadata:
-            return {
-                "name": metadata["name"],
-                "description": metadata["description"],
-            }
+
+def _parse_frontmatter(content: str) -> dict[str, str] | None:
+    """Extract the name and description from SKILL.md content."""
+    match = _FRONTMATTER_PATTERN.match(content)
+    if not match:
         return None
+
+    metadata = _scan_flat_mapping(match.group(1))
+    if metadata is None:
+        import yaml
+
+        metadata = yaml.safe_load(match.group(1))
+    if isinstance(metadata, dict) and "name" in metadata and "description" in metadata:
+        return {
+            "name": metadata["name"],
+            "description": metadata["description"],
+        }
+    return None
+
+
+def _read_frontmatter_bytes(skill_file: Path) -> bytes:
+    """Read a SKILL.md only as far as the end of its frontmatter, skipping the body.
+
+    A file without a closing delimiter is read whole, and a file that does not start with "---"
+    yields no bytes; both parse exactly as the full file would.
+    """
+    fd = os.open(skill_file, os.O_RDONLY)
+    try:
+        data = bytearray()
+        while chunk := os.read(fd, _FRONTMATTER_READ_SIZE):
+            data += chunk
+            if not data.startswith(b"---"[: len(data)]):
+                return b""
+            # The closing delimiter can only start on a line after the opening one.
+            opening_end = data.find(b"\n") + 1
+            if opening_end and (match := _FRONTMATTER_CLOSE_PATTERN.search(data, opening_end)):
+                return bytes(data[: match.end()])
+        return bytes(data)
+    finally:
+        os.close(fd)
+
+
+def _read_skill_metadata(skill_file: Path) -> dict[str, str] | None:
+    """Read a SKILL.md's frontmatter and extract its name and description, raising on errors."""
+    return _parse_frontmatter(_read_frontmatter_bytes(skill_file).decode("utf-8"))
+
+
+def parse_skill_metadata(skill_file: Path) -> dict[str, str] | None:
+    """Parse YAML frontmatter from a SKILL.md file."""
+    try:
+        return _read_skill_metadata(skill_file)
     except Exception as e:
         logger.error(f"Failed to parse metadata from {skill_file}: {e}")
         return None
 
 
+def _load_skill(skill_file: Path) -> Skill | Exception | None:
+    """Read and parse the frontmatter of a SKILL.md file into a Skill.
+
+    Errors are returned rather than raised so that a single unreadable or malformed skill
+    does not abort a parallel discovery run.
+    """
+    try:
+        metadata = _read_skill_metadata(skill_file)
+        return Skill(**metadata) if metadata else None
+    except Exception as e:
+        return e
+
+
 def discover_skills(skills_directory: Path) -> list[Skill]:
     """Discover available skills and return their metadata."""
-    if not skills_directory.exists():
+    try:
+        dir_mtime_ns = os.stat(skills_directory).st_mtime_ns
+    except FileNotFoundError:
         logger.warning(f"Skills directory not found: {skills_directory}")
         return []
 
-    skills = []
-    for skill_dir in sorted(skills_directory.iterdir()):
-        if not skill_dir.is_dir():
+    # The directory's mtime changes whenever an entry is added, removed or renamed, so the listing
+    # is only rescanned then. Edits inside a skill directory are caught by the SKILL.md stats below.
+    cached_listing = _skill_dirs_cache.get(str(skills_directory))
+    if cached_listing is not None and cached_listing[0] == dir_mtime_ns:
+        skill_files = cached_listing[1]
+    else:
+        # scandir entries carry the file type from readdir, so only symlinked entries need a stat.
+        with os.scandir(skills_directory) as it:
+            skill_dirs = sorted((entry for entry in it if entry.is_dir()), key=lambda entry: entry.name)
+        skill_files = [Path(skill_dir.path, "SKILL.md") for skill_dir in skill_dirs]
+        _skill_dirs_cache[str(skills_directory)] = (dir_mtime_ns, skill_files)
+
+    # Stat every SKILL.md; files whose mtime and size are unchanged are served from the cache.
+    stat_keys: list[tuple[Path, tuple[int, int]]] = []
+    for skill_file in skill_files:
+        try:
+            st = skill_file.stat()
+        except (FileNotFoundError, NotADirectoryError):
             continue
-
-        skill_file = skill_dir / "SKILL.md"
-        if not skill_file.exists():
+        except OSError as e:
+            logger.error(f"Failed to read skill {skill_file.parent.name}: {e}")
+            continue
+        stat_keys.append((skill_file, (st.st_mtime_ns, st.st_size)))
+
+    # Only new or changed files are read and parsed. Below _PARALLEL_THRESHOLD files the thread
+    # pool costs more than it saves; above it, blocking reads overlap since they release the GIL.
+    stale = [
+        (skill_file, key)
+        for skill_file, key in stat_keys
+        if (cached := _skill_metadata_cache.get(str(skill_file))) is None or cached[0] != key
+    ]
+    if len(stale) < _PARALLEL_THRESHOLD:
+        results = [_load_skill(skill_file) for skill_file, _ in stale]
+    else:
+        with ThreadPoolExecutor(max_workers=min(32, len(stale))) as executor:
+            results = list(executor.map(_load_skill, [skill_file for skill_file, _ in stale]))
+
+    for (skill_file, key), result in zip(stale, results):
+        if isinstance(result, FileNotFoundError):
+            continue
+        if isinstance(result, OSError):
+            logger.error(f"Failed to read skill {skill_file.parent.name}: {result}")
             continue
+        _skill_metadata_cache[str(skill_file)] = (key, result)
 
-        try:
-            metadata = parse_skill_metadata(skill_file)
-            if metadata:
-                skills.append(Skill(**metadata))
-        except Exception as e:
-            logger.error(f"Failed to parse skill {skill_dir.name}: {e}")
+    skills = []
+    for skill_file, key in stat_keys:
+        cached = _skill_metadata_cache.get(str(skill_file))
+        if cached is None or cached[0] != key:
+            continue
+        result = cached[1]
+        if isinstance(result, Exception):
+            logger.warning(f"Failed to parse skill {skill_file.parent.name}: {result}")
+        elif result is not None:
+            skills.append(result)
 
     return skills
 
 
+@functools.lru_cache(maxsize=128)
+def _load_skill_content_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a SKILL.md; the mtime and size in the cache key invalidate entries when it changes."""
+    # A raw fd read sized from the stat takes one read syscall and skips the buffered IO layer.
+    return load_bytes(path, size).decode("utf-8")
+
+
 def load_skill_content(skills_directory: Path, skill_name: str) -> str:
     """Load and return the full content of a skill's SKILL.md file."""
     # Find skill directory
     skill_dir = skills_directory / skill_name
-    if not skill_dir.exists() or not skill_dir.is_dir():
+    if not skill_dir.is_dir():
         raise FileNotFoundError(f"Skill '{skill_name}' not found in {skills_directory}")
 
     skill_file = skill_dir / "SKILL.md"
-    if not skill_file.exists():
-        raise FileNotFoundError(f"Skill '{skill_name}' has no SKILL.md file in {skill_dir}")
+    try:
+        st = skill_file.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Skill '{skill_name}' has no SKILL.md file in {skill_dir}") from None
 
     try:
-        with open(skill_file, encoding="utf-8") as f:
-            content = f.read()
-        return content
+        return _load_skill_content_cached(str(skill_file), st.st_mtime_ns, st.st_size)
     except Exception as e:
         logger.error(f"Failed to load skill {skill_name}: {e}")
         raise OSError(f"Error loading skill '{skill_name}': {e}") from e
@@ -18,3 +18,16 @@ class Skill(BaseModel):
 
     license: str | None = None
     """Optional license information for the skill."""
+
+
+class FileEdit(BaseModel):
+    """A single exact string replacement within a batch of file edits."""
+
+    old_string: str
+    """The exact text to replace."""
+
+    new_string: str
+    """The text to replace it with."""
+
+    replace_all: bool = False
+    """Replace every occurrence instead of requiring old_string to be unique."""
@@ -14,12 +14,8 @@ def generate_skills_xml(skills: list[Skill]) -> str:
     return "<available_skills>\n" + "\n".join(skills_entries) + "\n</available_skills>"
 
 
-def generate_skills_tool_description(skills: list[Skill]) -> str:
-    """Generates the full, standardized description for the 'skills' tool."""
-    skills_xml = generate_skills_xml(skills)
-
-    # This description is based on the ADK version, which is the source of truth.
-    description = f"""Execute a skill within the main conversation
+# This description is based on the ADK version, which is the source of truth.
+_SKILLS_TOOL_DESCRIPTION_TEMPLATE = """Execute a skill within the main conversation
 
 <skills_instructions>
 When users ask you to perform tasks, check if any of the available skills below can help complete the task more effectively. Skills provide specialized capabilities and domain knowledge.
@@ -41,7 +37,11 @@ Important:
 
 {skills_xml}
 """
-    return description
+
+
+def generate_skills_tool_description(skills: list[Skill]) -> str:
+    """Generates the full, standardized description for the 'skills' tool."""
+    return _SKILLS_TOOL_DESCRIPTION_TEMPLATE.format_map({"skills_xml": generate_skills_xml(skills)})
 
 
 def get_read_file_description() -> str:
@@ -58,6 +58,19 @@ Usage:
 """
 
 
+def get_read_files_description() -> str:
+    """Returns the standardized description for the read_files tool."""
+    return """Reads several files from the filesystem at once, with line numbers.
+
+Usage:
+- Provide a list of up to 20 paths (absolute or relative to your working directory)
+- Files are read concurrently; prefer this over several read_file calls
+- Each file is returned under its path, in the same format as read_file
+- A file that cannot be read is reported with its error; the others are still returned
+- Use read_file with offset and limit for specific line ranges of a large file
+"""
+
+
 def get_write_file_description() -> str:
     """Returns the standardized description for the write_file tool."""
     return """Writes content to a file on the filesystem.
@@ -89,6 +102,21 @@ Usage:
 """
 
 
+def get_edit_file_batch_description() -> str:
+    """Returns the standardized description for the edit_file_batch tool."""
+    return """Applies several exact string replacements to one file in a single step.
+
+Usage:
+- You must read the file first using read_file
+- Provide path (absolute or relative to working directory) and a list of edits
+- Each edit has old_string, new_string and an optional replace_all, with the same rules as edit_file
+- Edits are applied in order, each to the result of the previous ones
+- If any edit fails, the file is left unchanged
+- Prefer this over several edit_file calls on the same file
+- Note: skills/ directory is read-only
+"""
+
+
 def get_bash_description() -> str:
     """Returns the standardized description for the bash tool."""
     # This combines the useful parts from both ADK and OpenAI descriptions
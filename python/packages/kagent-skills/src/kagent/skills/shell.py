@@ -3,16 +3,43 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
+import functools
+import itertools
 import logging
+import mmap
 import os
 import re
+import stat
+import uuid
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from ._files import load_bytes
+from .models import FileEdit
+
 logger = logging.getLogger(__name__)
 
 
 # --- File Operation Tools ---
 
+# Buffer size for streamed reads of a line window; larger than io.DEFAULT_BUFFER_SIZE
+# so long files are scanned with fewer read syscalls.
+_READ_BUFFER_SIZE = 128 * 1024
+
+# Lines longer than this are truncated in read_file output.
+_MAX_LINE_LENGTH = 2000
+
+# read_files accepts at most this many paths per call.
+_MAX_READ_FILES = 20
+
+# Files up to this size are kept in the read cache; larger files are always read from disk.
+_MAX_CACHED_FILE_SIZE = 1024 * 1024
+
+# ASCII control characters that str.splitlines() treats as line breaks but bytes.splitlines() does not.
+_EXTRA_LINE_BREAK_BYTES = re.compile(rb"[\x0b\x0c\x1c-\x1e]")
+
 
 def _validate_path(
     file_path: Path,
@@ -32,6 +59,94 @@ def _validate_path(
     raise PermissionError(f"Access denied: {resolved} is outside the allowed directories: {root_list}")
 
 
+def _stat_file(file_path: Path) -> os.stat_result:
+    """Stat a path once, raising if it is missing or not a regular file."""
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
+
+    if not stat.S_ISREG(st.st_mode):
+        raise IsADirectoryError(f"Path is not a file: {file_path}")
+    return st
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode file bytes, applying text-mode universal newline translation."""
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+@functools.lru_cache(maxsize=64)
+def _load_text_cached(path: str, ino: int, mtime_ns: int, size: int) -> str:
+    """Read and decode a file; inode, mtime_ns and size are part of the key so a modified file misses.
+
+    The file tools replace files by rename, which gives them a new inode, so their writes always
+    miss even when the size and timestamp happen to match the old file.
+    """
+    return _decode_text(load_bytes(path, size))
+
+
+def _read_text(file_path: Path, st: os.stat_result) -> str:
+    """Read a file's text, reusing the cached copy if the file is unchanged since the last read."""
+    if st.st_size > _MAX_CACHED_FILE_SIZE:
+        return _decode_text(load_bytes(str(file_path), st.st_size))
+    return _load_text_cached(str(file_path), st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _iter_lines(f: Iterable[str]) -> Iterator[str]:
+    """Yield the lines of a text-mode file, split by the same rule as str.splitlines().
+
+    File iteration only breaks on newlines, so each physical line is split again on the other
+    line boundaries (form feed, U+2028 and so on) to number lines as a whole-file read does.
+    """
+    for line in f:
+        yield from line.splitlines()
+
+
+def _write_atomic(file_path: Path, chunks: Iterable[bytes]) -> None:
+    """Write chunks to a temporary file beside file_path and rename it over the target.
+
+    Readers never observe a partially written file. An existing file keeps its permission bits.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    tmp_path = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        try:
+            if mode is not None:
+                os.fchmod(fd, mode)
+            for chunk in chunks:
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _format_ascii_lines(lines: list[bytes], first_line: int) -> str:
+    """Number and truncate ASCII lines as bytes, decoding only the final output.
+
+    For ASCII content byte and character lengths agree, so this matches the str formatter in
+    read_file_content while skipping the per-line str work on large files.
+    """
+    if max(map(len, lines)) > _MAX_LINE_LENGTH:
+        lines = [line if len(line) <= _MAX_LINE_LENGTH else line[:_MAX_LINE_LENGTH] + b"..." for line in lines]
+
+    prefixes = [b"%6d|" % i for i in range(first_line, first_line + len(lines))]
+    return b"\n".join([prefix + line for prefix, line in zip(prefixes, lines)]).decode("ascii")
+
+
 def read_file_content(
     file_path: Path,
     offset: int | None = None,
@@ -41,30 +156,60 @@ def read_file_content(
     """Reads a file with line numbers, raising errors on failure."""
     file_path = _validate_path(file_path, allowed_root)
 
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    st = _stat_file(file_path)
 
-    if not file_path.is_file():
-        raise IsADirectoryError(f"Path is not a file: {file_path}")
+    start = (offset - 1) if offset and offset > 0 else 0
 
     try:
-        lines = file_path.read_text(encoding="utf-8").splitlines()
-    except Exception as e:
+        if limit and limit > 0:
+            # Stream only the requested window so lines past start + limit are never read.
+            with file_path.open(encoding="utf-8", buffering=_READ_BUFFER_SIZE) as f:
+                lines = list(itertools.islice(_iter_lines(f), start, start + limit))
+        elif st.st_size > _MAX_CACHED_FILE_SIZE:
+            data = load_bytes(str(file_path), st.st_size)
+            # bytes.splitlines() agrees with the str paths only when no other line-break bytes are present.
+            if data.isascii() and not _EXTRA_LINE_BREAK_BYTES.search(data):
+                lines = data.splitlines()[start:]
+            else:
+                lines = _decode_text(data).splitlines()[start:]
+        else:
+            lines = _read_text(file_path, st).splitlines()[start:]
+    except (OSError, UnicodeError) as e:
         raise OSError(f"Error reading file {file_path}: {e}") from e
 
-    start = (offset - 1) if offset and offset > 0 else 0
-    end = (start + limit) if limit else len(lines)
+    if not lines:
+        return "File is empty."
 
-    result_lines = []
-    for i, line in enumerate(lines[start:end], start=start + 1):
-        if len(line) > 2000:
-            line = line[:2000] + "..."
-        result_lines.append(f"{i:6d}|{line}")
+    if isinstance(lines[0], bytes):
+        return _format_ascii_lines(lines, start + 1)
 
-    if not result_lines:
-        return "File is empty."
+    # Over-long lines are rare, so only pay for per-line truncation when one is present.
+    if max(map(len, lines)) > _MAX_LINE_LENGTH:
+        lines = [line if len(line) <= _MAX_LINE_LENGTH else line[:_MAX_LINE_LENGTH] + "..." for line in lines]
+
+    return "\n".join([f"{i:6d}|{line}" for i, line in enumerate(lines, start=start + 1)])
+
+
+def read_files_content(
+    file_paths: list[Path],
+    allowed_root: Path | list[Path] | None = None,
+) -> dict[str, str]:
+    """Reads several files concurrently, mapping each path to its content or error message."""
+    if not file_paths:
+        return {}
+
+    if len(file_paths) > _MAX_READ_FILES:
+        raise ValueError(f"Too many files: {len(file_paths)} requested, at most {_MAX_READ_FILES} per call")
+
+    def _read_one(file_path: Path) -> str:
+        try:
+            return read_file_content(file_path, allowed_root=allowed_root)
+        except OSError as e:
+            return f"Error: {e}"
 
-    return "\n".join(result_lines)
+    with ThreadPoolExecutor(max_workers=min(32, len(file_paths))) as executor:
+        results = list(executor.map(_read_one, file_paths))
+    return {str(file_path): result for file_path, result in zip(file_paths, results)}
 
 
 def write_file_content(file_path: Path, content: str, allowed_root: Path | None = None) -> str:
@@ -72,13 +217,16 @@ def write_file_content(file_path: Path, content: str, allowed_root: Path | None
     file_path = _validate_path(file_path, allowed_root)
 
     try:
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content, encoding="utf-8")
-        logger.info(f"Successfully wrote to {file_path}")
-        return f"Successfully wrote to {file_path}"
-    except Exception as e:
+        # The parent nearly always exists already; one stat is cheaper than mkdir's walk.
+        if not os.path.isdir(file_path.parent):
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(file_path, (content.encode("utf-8"),))
+    except (OSError, UnicodeError) as e:
         raise OSError(f"Error writing file {file_path}: {e}") from e
 
+    logger.info("Successfully wrote to %s", file_path)
+    return f"Successfully wrote to {file_path}"
+
 
 def edit_file_content(
     file_path: Path,
@@ -88,42 +236,128 @@ def edit_file_content(
     allowed_root: Path | None = None,
 ) -> str:
     """Performs an exact string replacement in a file."""
+    if not old_string:
+        raise ValueError("old_string must not be empty")
+
     if old_string == new_string:
         raise ValueError("old_string and new_string must be different")
 
     file_path = _validate_path(file_path, allowed_root)
 
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    if not file_path.is_file():
-        raise IsADirectoryError(f"Path is not a file: {file_path}")
+    st = _stat_file(file_path)
 
+    # A single handler covers reading and writing; the ValueErrors raised for a missing or
+    # ambiguous old_string are not caught and reach the caller unchanged.
+    content = None
     try:
-        content = file_path.read_text(encoding="utf-8")
-    except Exception as e:
-        raise OSError(f"Error reading file {file_path}: {e}") from e
+        if st.st_size > _MAX_CACHED_FILE_SIZE:
+            # Large LF-only files are searched through a read-only mapping: UTF-8 substring matches
+            # are exact at the byte level, and the file contents never enter the Python heap.
+            with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b"\r") == -1:
+                    # Reject invalid UTF-8 exactly as the decoding paths do, so results never depend on size.
+                    _check_utf8(mm)
+                    old, new = old_string.encode("utf-8"), new_string.encode("utf-8")
+                    offsets = []
+                    pos = mm.find(old)
+                    while pos != -1:
+                        offsets.append(pos)
+                        pos = mm.find(old, pos + len(old))
+                    _check_occurrences(file_path, len(offsets), replace_all)
+                    _write_atomic(file_path, _mapped_replace_chunks(mm, offsets, len(old), new))
+                    count = len(offsets)
+                else:
+                    content = _decode_text(mm[:])
+        else:
+            content = _read_text(file_path, st)
+
+        if content is not None:
+            # A single split finds, counts and locates every occurrence in one scan.
+            parts = content.split(old_string)
+            count = len(parts) - 1
+            _check_occurrences(file_path, count, replace_all)
+            _write_atomic(file_path, (new_string.join(parts).encode("utf-8"),))
+    except (OSError, UnicodeError) as e:
+        raise OSError(f"Error editing file {file_path}: {e}") from e
+
+    logger.info("Successfully replaced %d occurrence(s) in %s", count, file_path)
+    return f"Successfully replaced {count} occurrence(s) in {file_path}"
+
+
+def edit_file_batch_content(
+    file_path: Path,
+    edits: list[FileEdit],
+    allowed_root: Path | None = None,
+) -> str:
+    """Applies several exact string replacements to a file in order, reading and writing it once.
+
+    Every edit must succeed against the result of the previous ones; otherwise the file is left unchanged.
+    """
+    if not edits:
+        raise ValueError("edits must not be empty")
+
+    for i, edit in enumerate(edits, start=1):
+        if not edit.old_string:
+            raise ValueError(f"Edit {i}: old_string must not be empty")
+        if edit.old_string == edit.new_string:
+            raise ValueError(f"Edit {i}: old_string and new_string must be different")
+
+    file_path = _validate_path(file_path, allowed_root)
 
-    if old_string not in content:
+    st = _stat_file(file_path)
+
+    count = 0
+    try:
+        if st.st_size > _MAX_CACHED_FILE_SIZE:
+            content = _decode_text(load_bytes(str(file_path), st.st_size))
+        else:
+            content = _read_text(file_path, st)
+
+        for i, edit in enumerate(edits, start=1):
+            parts = content.split(edit.old_string)
+            try:
+                _check_occurrences(file_path, len(parts) - 1, edit.replace_all)
+            except ValueError as e:
+                raise ValueError(f"Edit {i}: {e}") from None
+            count += len(parts) - 1
+            content = edit.new_string.join(parts)
+
+        _write_atomic(file_path, (content.encode("utf-8"),))
+    except (OSError, UnicodeError) as e:
+        raise OSError(f"Error editing file {file_path}: {e}") from e
+
+    logger.info("Successfully applied %d edit(s) replacing %d occurrence(s) in %s", len(edits), count, file_path)
+    return f"Successfully applied {len(edits)} edit(s) replacing {count} occurrence(s) in {file_path}"
+
+
+def _check_occurrences(file_path: Path, count: int, replace_all: bool) -> None:
+    """Reject an edit whose old_string is missing or, without replace_all, ambiguous."""
+    if count == 0:
         raise ValueError(f"old_string not found in {file_path}")
 
-    count = content.count(old_string)
     if not replace_all and count > 1:
         raise ValueError(
             f"old_string appears {count} times in {file_path}. Provide more context or set replace_all=true."
         )
 
-    if replace_all:
-        new_content = content.replace(old_string, new_string)
-    else:
-        new_content = content.replace(old_string, new_string, 1)
 
-    try:
-        file_path.write_text(new_content, encoding="utf-8")
-        logger.info(f"Successfully replaced {count} occurrence(s) in {file_path}")
-        return f"Successfully replaced {count} occurrence(s) in {file_path}"
-    except Exception as e:
-        raise OSError(f"Error writing file {file_path}: {e}") from e
+def _check_utf8(mm: mmap.mmap) -> None:
+    """Raise UnicodeDecodeError if the mapped file is not valid UTF-8, decoding it in bounded chunks."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for pos in range(0, len(mm), _READ_BUFFER_SIZE):
+        decoder.decode(mm[pos : pos + _READ_BUFFER_SIZE])
+    decoder.decode(b"", final=True)
+
+
+def _mapped_replace_chunks(mm: mmap.mmap, offsets: list[int], old_len: int, new: bytes) -> Iterable[bytes]:
+    """Yield the mapped file with new substituted at each offset, in bounded-size chunks."""
+    prev = 0
+    for end in [*offsets, len(mm)]:
+        for pos in range(prev, end, _READ_BUFFER_SIZE):
+            yield mm[pos : min(pos + _READ_BUFFER_SIZE, end)]
+        if end < len(mm):
+            yield new
+        prev = end + old_len
 
 
 # --- Shell Operation Tools ---
@@ -159,6 +393,12 @@ def _sanitize_env(env: dict[str, str] | None = None) -> dict[str, str]:
     return {k: v for k, v in source.items() if k not in _SECRET_ENV_NAMES and not _SECRET_PATTERNS.search(k)}
 
 
+# Command output past this size is elided from the middle so long-running commands
+# (package installs, builds) cannot buffer unbounded output in memory.
+_OUTPUT_HEAD_BYTES = 64 * 1024
+_OUTPUT_TAIL_BYTES = 64 * 1024
+
+
 def _get_srt_settings_args() -> list[str]:
     """Return srt settings args using the mounted config path."""
     settings_path_env = os.environ.get("KAGENT_SRT_SETTINGS_PATH", "").strip()
@@ -175,6 +415,27 @@ def _get_command_timeout_seconds(command: str) -> float:
         return 30.0  # 30 seconds for other commands
 
 
+async def _read_capped(stream: asyncio.StreamReader) -> bytes:
+    """Read a stream to EOF, keeping only its head and tail once it exceeds the output cap."""
+    head = bytearray()
+    tail = bytearray()
+    elided = 0
+    while chunk := await stream.read(_READ_BUFFER_SIZE):
+        if len(head) < _OUTPUT_HEAD_BYTES:
+            take = _OUTPUT_HEAD_BYTES - len(head)
+            head += chunk[:take]
+            chunk = chunk[take:]
+        tail += chunk
+        if len(tail) > _OUTPUT_TAIL_BYTES:
+            excess = len(tail) - _OUTPUT_TAIL_BYTES
+            del tail[:excess]
+            elided += excess
+
+    if elided:
+        return bytes(head) + f"\n[... {elided} bytes elided ...]\n".encode() + bytes(tail)
+    return bytes(head + tail)
+
+
 async def execute_command(
     command: str,
     working_dir: Path,
@@ -215,7 +476,10 @@ async def execute_command(
         )
 
         try:
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+            stdout, stderr, _ = await asyncio.wait_for(
+                asyncio.gather(_read_capped(process.stdout), _read_capped(process.stderr), process.wait()),
+                timeout=timeout,
+            )
         except TimeoutError:
             process.kill()
             await process.wait()
@@ -236,7 +500,7 @@ async def execute_command(
         if stderr_str and "WARNING" not in stderr_str:
             output += f"\n{stderr_str}"
 
-        logger.info(f"Command executed successfully: {output}")
+        logger.info("Command executed successfully: %s", output)
 
         return output.strip() if output.strip() else "Command completed successfully."
 
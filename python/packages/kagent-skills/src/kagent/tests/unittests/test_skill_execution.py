@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import shutil
@@ -9,16 +10,34 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from kagent.skills import (
+    FileEdit,
     discover_skills,
+    edit_file_batch_content,
     edit_file_content,
     execute_command,
     load_skill_content,
     read_file_content,
+    read_files_content,
     write_file_content,
 )
+from kagent.skills.discovery import parse_skill_metadata
 from kagent.skills.shell import _get_srt_settings_args, _sanitize_env
 
 
+def _mock_process(stdout: bytes = b"ok", stderr: bytes = b"", returncode: int = 0) -> MagicMock:
+    """Build a fake subprocess whose stdout/stderr streams yield the given bytes."""
+    process = MagicMock()
+    process.stdout = asyncio.StreamReader()
+    process.stdout.feed_data(stdout)
+    process.stdout.feed_eof()
+    process.stderr = asyncio.StreamReader()
+    process.stderr.feed_data(stderr)
+    process.stderr.feed_eof()
+    process.wait = AsyncMock(return_value=returncode)
+    process.returncode = returncode
+    return process
+
+
 @pytest.fixture
 def skill_test_env() -> Path:
     """
@@ -93,7 +112,7 @@ def skill_test_env() -> Path:
         shutil.rmtree(top_level_dir)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_skill_core_logic(skill_test_env: Path):
     """
     Tests the core logic of the 'csv-to-json' skill by directly
@@ -145,7 +164,7 @@ async def test_skill_core_logic(skill_test_env: Path):
     assert json.loads(json_content_str) == expected_data
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_execute_command_no_shell_injection(tmp_path):
     """
     Verifies that shell metacharacters in the command are not interpreted by an
@@ -156,10 +175,7 @@ async def test_execute_command_no_shell_injection(tmp_path):
 
     async def mock_exec(*args, **kwargs):
         captured["args"] = args
-        mock_process = MagicMock()
-        mock_process.communicate = AsyncMock(return_value=(b"ok", b""))
-        mock_process.returncode = 0
-        return mock_process
+        return _mock_process()
 
     injection_payload = 'ls"; cat /etc/passwd; echo "pwned'
 
@@ -183,6 +199,26 @@ async def test_execute_command_no_shell_injection(tmp_path):
     assert list(args).count(injection_payload) == 1
 
 
+@pytest.mark.asyncio(loop_scope="module")
+async def test_execute_command_elides_large_output(tmp_path):
+    """Output beyond the cap keeps its head and tail with an elision marker in between."""
+    stdout = b"H" * 70_000 + b"M" * 200_000 + b"T" * 70_000
+
+    async def mock_exec(*args, **kwargs):
+        return _mock_process(stdout=stdout)
+
+    with (
+        patch.dict("os.environ", {"KAGENT_SRT_SETTINGS_PATH": "/config/srt-settings.json"}, clear=False),
+        patch("asyncio.create_subprocess_exec", side_effect=mock_exec),
+    ):
+        result = await execute_command("make build", working_dir=tmp_path)
+
+    head, marker, tail = result.split("\n")
+    assert head == "H" * 65_536
+    assert marker == f"[... {len(stdout) - 2 * 65_536} bytes elided ...]"
+    assert tail == "T" * 65_536
+
+
 def test_get_srt_settings_args_uses_mounted_path():
     """Mounted srt settings should be used when the env var is present."""
     with patch.dict("os.environ", {"KAGENT_SRT_SETTINGS_PATH": "/config/srt-settings.json"}, clear=True):
@@ -198,6 +234,181 @@ def test_get_srt_settings_args_requires_mounted_path():
             _get_srt_settings_args()
 
 
+def test_read_file_offset_and_limit(tmp_path):
+    """offset is 1-indexed and limit caps the number of returned lines."""
+    f = tmp_path / "lines.txt"
+    f.write_text("".join(f"line {i}\n" for i in range(1, 11)))
+
+    assert read_file_content(f, offset=3, limit=2) == "     3|line 3\n     4|line 4"
+    assert read_file_content(f, offset=9) == "     9|line 9\n    10|line 10"
+    assert read_file_content(f, limit=1) == "     1|line 1"
+    assert read_file_content(f, offset=20, limit=5) == "File is empty."
+
+
+def test_read_file_window_matches_full_read(tmp_path):
+    """A windowed read numbers lines exactly like a full read, including non-newline line breaks."""
+    f = tmp_path / "breaks.txt"
+    f.write_text("a\x0cb\nc\u2028d\ne\n", encoding="utf-8", newline="")
+
+    full = read_file_content(f).split("\n")
+    assert full == ["     1|a", "     2|b", "     3|c", "     4|d", "     5|e"]
+    for offset in range(1, 6):
+        assert read_file_content(f, offset=offset, limit=1) == full[offset - 1]
+        assert read_file_content(f, offset=offset) == "\n".join(full[offset - 1 :])
+
+
+def test_read_file_truncates_long_lines(tmp_path):
+    """Lines longer than 2000 characters are truncated; other lines are untouched."""
+    f = tmp_path / "wide.txt"
+    f.write_text("short\n" + "x" * 2500 + "\n")
+
+    result = read_file_content(f).splitlines()
+
+    assert result[0] == "     1|short"
+    assert result[1] == "     2|" + "x" * 2000 + "..."
+
+
+def test_read_file_rejects_binary_files(tmp_path):
+    """Images and other binary files are reported as read errors rather than returned as text."""
+    f = tmp_path / "pixel.png"
+    f.write_bytes(b"\x89PNG\r\n\x1a\n\xff\x00")
+
+    with pytest.raises(OSError, match="Error reading file"):
+        read_file_content(f)
+
+
+def test_read_file_large_ascii_file(tmp_path):
+    """Large ASCII files are numbered and truncated exactly like small ones."""
+    f = tmp_path / "big.log"
+    f.write_text("".join(f"entry {i}\r\n" for i in range(1, 200_001)) + "y" * 2500 + "\n")
+
+    result = read_file_content(f, offset=199_999).split("\n")
+
+    assert result == ["199999|entry 199999", "200000|entry 200000", "200001|" + "y" * 2000 + "..."]
+
+
+def test_read_file_large_ascii_file_line_breaks(tmp_path):
+    """Form feeds and other control line breaks number lines the same in large and small files."""
+    f = tmp_path / "big.txt"
+    f.write_bytes(b"x" * 1_100_000 + b"\na\x0cb\x1ec\n")
+
+    expected = "     2|a\n     3|b\n     4|c"
+    assert read_file_content(f, offset=2) == expected
+    assert read_file_content(f, offset=2, limit=3) == expected
+
+
+def test_edit_file_rejects_invalid_utf8_at_any_size(tmp_path):
+    """Small and large files with invalid UTF-8 are refused alike and left untouched."""
+    for name, size in [("small.txt", 10), ("large.txt", 1_100_000)]:
+        f = tmp_path / name
+        data = b"x" * size + b"\nneedle\n\xff\n"
+        f.write_bytes(data)
+
+        with pytest.raises(OSError, match="Error editing file"):
+            edit_file_content(f, "needle", "pin")
+        assert f.read_bytes() == data
+
+
+def test_edit_file_replacements(tmp_path):
+    """edit_file replaces a unique match, rejects ambiguous ones and honours replace_all."""
+    f = tmp_path / "code.py"
+    f.write_text("a = 1\nb = 1\nc = 2\n")
+
+    assert "1 occurrence(s)" in edit_file_content(f, "c = 2", "c = 3")
+    assert f.read_text() == "a = 1\nb = 1\nc = 3\n"
+
+    with pytest.raises(ValueError, match="appears 2 times"):
+        edit_file_content(f, "= 1", "= 0")
+    with pytest.raises(ValueError, match="not found"):
+        edit_file_content(f, "d = 4", "d = 5")
+
+    assert "2 occurrence(s)" in edit_file_content(f, "= 1", "= 0", replace_all=True)
+    assert f.read_text() == "a = 0\nb = 0\nc = 3\n"
+
+
+def test_edit_file_large_file(tmp_path):
+    """Edits on files larger than the read cache limit keep non-ASCII content intact."""
+    f = tmp_path / "big.txt"
+    f.write_text("héllo wörld\n" * 100_000 + "needle → here\n", encoding="utf-8")
+
+    assert "1 occurrence(s)" in edit_file_content(f, "needle → here", "found ✓")
+    content = f.read_text(encoding="utf-8")
+    assert content.endswith("héllo wörld\nfound ✓\n")
+    assert content.count("héllo wörld") == 100_000
+
+    with pytest.raises(ValueError, match="appears 100000 times"):
+        edit_file_content(f, "wörld", "world")
+    assert "100000 occurrence(s)" in edit_file_content(f, "wörld", "world", replace_all=True)
+    assert f.read_text(encoding="utf-8") == "héllo world\n" * 100_000 + "found ✓\n"
+
+
+def test_edit_file_batch(tmp_path):
+    """Batched edits apply in order, and a failing edit leaves the file untouched."""
+    f = tmp_path / "app.py"
+    f.write_text("x = 1\ny = x + x\n")
+
+    result = edit_file_batch_content(
+        f,
+        [FileEdit(old_string="x", new_string="z", replace_all=True), FileEdit(old_string="z = 1", new_string="z = 2")],
+    )
+    assert "2 edit(s) replacing 4 occurrence(s)" in result
+    assert f.read_text() == "z = 2\ny = z + z\n"
+
+    with pytest.raises(ValueError, match="Edit 2: old_string not found"):
+        edit_file_batch_content(f, [FileEdit(old_string="y", new_string="w"), FileEdit(old_string="y", new_string="v")])
+    assert f.read_text() == "z = 2\ny = z + z\n"
+
+
+def test_write_file_replaces_atomically(tmp_path):
+    """Writes go through a temporary file, keep the target's mode and leave no temp files behind."""
+    f = tmp_path / "script.sh"
+    f.write_text("echo old\n")
+    f.chmod(0o755)
+
+    write_file_content(f, "echo new\n", allowed_root=tmp_path)
+    edit_file_content(f, "new", "newer", allowed_root=tmp_path)
+
+    assert f.read_text() == "echo newer\n"
+    assert f.stat().st_mode & 0o777 == 0o755
+    assert [p.name for p in tmp_path.iterdir()] == ["script.sh"]
+
+
+def test_read_file_sees_writes_and_edits(tmp_path):
+    """Repeated reads must reflect writes made through the tools and directly on disk."""
+    f = tmp_path / "notes.txt"
+    write_file_content(f, "first\n")
+    assert read_file_content(f) == "     1|first"
+
+    edit_file_content(f, "first", "second")
+    assert read_file_content(f) == "     1|second"
+
+    # Same-size rewrites made within one timestamp tick must not be served from the cache.
+    write_file_content(f, "sec0nd\n")
+    assert read_file_content(f) == "     1|sec0nd"
+
+    f.write_text("third, longer\n")
+    assert read_file_content(f) == "     1|third, longer"
+
+
+def test_read_files_reports_each_file(tmp_path):
+    """read_files returns content per path and reports failures without aborting the batch."""
+    (tmp_path / "a.txt").write_text("alpha\n")
+    (tmp_path / "b.txt").write_text("beta\n")
+    missing = tmp_path / "missing.txt"
+
+    results = read_files_content([tmp_path / "a.txt", missing, tmp_path / "b.txt"], allowed_root=tmp_path)
+
+    assert results[str(tmp_path / "a.txt")] == "     1|alpha"
+    assert results[str(tmp_path / "b.txt")] == "     1|beta"
+    assert results[str(missing)].startswith("Error: File not found")
+
+
+def test_read_files_limits_path_count(tmp_path):
+    """read_files rejects more than 20 paths in a single call."""
+    with pytest.raises(ValueError, match="Too many files: 21 requested"):
+        read_files_content([tmp_path / f"{i}.txt" for i in range(21)], allowed_root=tmp_path)
+
+
 # --- Path traversal tests ---
 
 
@@ -301,6 +512,108 @@ def test_skill_discovery_and_loading(skill_test_env: Path):
     assert 'Example: `bash("python skills/csv-to-json/scripts/convert.py' in skill_content
 
 
+def test_skill_discovery_skips_malformed_skills(tmp_path):
+    """Malformed SKILL.md files are skipped without affecting the other skills."""
+    for name in ["alpha", "beta", "gamma"]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "SKILL.md").write_text(f"---\nname: {name}\ndescription: The {name} skill.\n---\n# {name}\n")
+    (tmp_path / "beta" / "SKILL.md").write_text("---\nname: [unclosed\n---\n")
+    (tmp_path / "no-frontmatter").mkdir()
+    (tmp_path / "no-frontmatter" / "SKILL.md").write_text("# Just a heading\n")
+
+    discovered = discover_skills(tmp_path)
+
+    assert [skill.name for skill in discovered] == ["alpha", "gamma"]
+
+
+def test_parse_skill_metadata(tmp_path):
+    """parse_skill_metadata returns the name and description, or None for a malformed file."""
+    good = tmp_path / "good.md"
+    good.write_text("---\nname: good\ndescription: A good skill.\n---\n# Good\n")
+    bad = tmp_path / "bad.md"
+    bad.write_text("---\nname: [unclosed\n---\n")
+
+    assert parse_skill_metadata(good) == {"name": "good", "description": "A good skill."}
+    assert parse_skill_metadata(bad) is None
+    assert parse_skill_metadata(tmp_path / "missing.md") is None
+
+
+def test_skill_discovery_frontmatter_delimiter_must_be_own_line(tmp_path):
+    """A "---" inside a frontmatter value must not terminate the frontmatter."""
+    (tmp_path / "diff-tool").mkdir()
+    (tmp_path / "diff-tool" / "SKILL.md").write_text(
+        "---\nname: diff-tool\ndescription: Compares old---new revisions.\n---\n# Diff\n"
+    )
+
+    discovered = discover_skills(tmp_path)
+
+    assert len(discovered) == 1
+    assert discovered[0].description == "Compares old---new revisions."
+
+
+def test_skill_discovery_frontmatter_yaml_fallback(tmp_path):
+    """Frontmatter beyond flat "key: value" lines is still parsed as full YAML."""
+    (tmp_path / "plain").mkdir()
+    (tmp_path / "plain" / "SKILL.md").write_text("---\nname: plain\ndescription: 'Quoted: yes'\n---\n")
+    (tmp_path / "folded").mkdir()
+    (tmp_path / "folded" / "SKILL.md").write_text(
+        "---\nname: folded\ndescription: >\n  Spans\n  two lines.\nmetadata:\n  tags: [a, b]\n---\n"
+    )
+    (tmp_path / "boolean").mkdir()
+    (tmp_path / "boolean" / "SKILL.md").write_text("---\nname: boolean\ndescription: yes\n---\n")
+
+    discovered = {skill.name: skill.description for skill in discover_skills(tmp_path)}
+
+    assert discovered == {"folded": "Spans two lines.\n", "plain": "Quoted: yes"}
+
+
+def test_skill_discovery_reads_only_frontmatter(tmp_path):
+    """Discovery stops reading at the end of the frontmatter, so the body is never decoded."""
+    (tmp_path / "binary-body").mkdir()
+    (tmp_path / "binary-body" / "SKILL.md").write_bytes(
+        b"---\nname: binary-body\ndescription: Ships a blob.\n---\n" + b"\xff\xfe" * 10_000
+    )
+
+    discovered = discover_skills(tmp_path)
+
+    assert [skill.description for skill in discovered] == ["Ships a blob."]
+
+
+def test_skill_discovery_reparses_only_changed_files(tmp_path):
+    """Repeat discovery reuses parsed metadata until a SKILL.md's mtime or size changes."""
+    skill_file = tmp_path / "notes" / "SKILL.md"
+    skill_file.parent.mkdir()
+    skill_file.write_text("---\nname: notes\ndescription: Takes notes.\n---\n")
+
+    assert discover_skills(tmp_path)[0].description == "Takes notes."
+    with patch("kagent.skills.discovery._load_skill") as load_skill:
+        assert discover_skills(tmp_path)[0].description == "Takes notes."
+    load_skill.assert_not_called()
+
+    skill_file.write_text("---\nname: notes\ndescription: Takes better notes.\n---\n")
+    assert discover_skills(tmp_path)[0].description == "Takes better notes."
+
+    (tmp_path / "todo").mkdir()
+    (tmp_path / "todo" / "SKILL.md").write_text("---\nname: todo\ndescription: Tracks tasks.\n---\n")
+    assert [skill.name for skill in discover_skills(tmp_path)] == ["notes", "todo"]
+
+
+def test_load_skill_content_sees_changes(tmp_path):
+    """Cached skill content is refreshed when SKILL.md changes on disk."""
+    skill_file = tmp_path / "notes" / "SKILL.md"
+    skill_file.parent.mkdir()
+    skill_file.write_text("---\nname: notes\ndescription: Takes notes.\n---\nv1\n")
+
+    assert load_skill_content(tmp_path, "notes").endswith("v1\n")
+    assert load_skill_content(tmp_path, "notes").endswith("v1\n")
+
+    skill_file.write_text("---\nname: notes\ndescription: Takes notes.\n---\nversion 2\n")
+    assert load_skill_content(tmp_path, "notes").endswith("version 2\n")
+
+    with pytest.raises(FileNotFoundError, match="not found"):
+        load_skill_content(tmp_path, "missing")
+
+
 def test_sanitize_env_strips_secrets():
     """Verify _sanitize_env removes env vars matching secret patterns."""
     secret_vars = {
@@ -344,17 +657,14 @@ def test_sanitize_env_strips_secrets():
         assert result[key] == value, f"{key} should be preserved"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_execute_command_strips_secret_env_vars(tmp_path):
     """Secret env vars must not be passed to sandboxed subprocesses."""
     captured = {}
 
     async def mock_exec(*args, **kwargs):
         captured["env"] = kwargs.get("env", {})
-        mock_process = MagicMock()
-        mock_process.communicate = AsyncMock(return_value=(b"ok", b""))
-        mock_process.returncode = 0
-        return mock_process
+        return _mock_process()
 
     env_overrides = {
         "OPENAI_API_KEY": "sk-secret",
@@ -1,5 +1,13 @@
 """Basic OpenAI Agent sample for KAgent."""
 
-from .agent import app
-
 __all__ = ["app"]
+
+
+def __getattr__(name: str):
+    # The agent module builds the app and reads its config at import time, so it is only
+    # loaded on first access; importing the calculator alone stays free of side effects.
+    if name == "app":
+        from .agent import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,53 @@
+"""Safe arithmetic evaluation for the calculate tool."""
+
+import ast
+import functools
+import operator
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPERATORS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+# Integer products and powers are capped at this many bits; larger ones take arbitrarily long to compute.
+_MAX_RESULT_BITS = 10_000
+
+
+def _result_bits(op: ast.operator, left: int | float, right: int | float) -> int:
+    """Upper bound on the bit length of an integer product or power, or 0 for other operations."""
+    if type(left) is not int or type(right) is not int:
+        return 0
+    if isinstance(op, ast.Mult):
+        return left.bit_length() + right.bit_length()
+    # Powers of 0, 1 and -1 stay small, and negative exponents give a float.
+    if isinstance(op, ast.Pow) and abs(left) > 1 and right > 0:
+        return abs(left).bit_length() * right
+    return 0
+
+
+def _evaluate(node: ast.AST) -> int | float:
+    """Evaluate an arithmetic expression tree, rejecting anything but numbers and operators."""
+    if isinstance(node, ast.Expression):
+        return _evaluate(node.body)
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        left, right = _evaluate(node.left), _evaluate(node.right)
+        if _result_bits(node.op, left, right) > _MAX_RESULT_BITS:
+            raise ValueError("result is too large")
+        return _BINARY_OPERATORS[type(node.op)](left, right)
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        return _UNARY_OPERATORS[type(node.op)](_evaluate(node.operand))
+    raise ValueError(f"unsupported syntax: {type(node).__name__}")
+
+
+@functools.lru_cache(maxsize=1024)
+def evaluate_expression(expression: str) -> int | float:
+    """Parse and evaluate an expression; repeated expressions are answered from the cache."""
+    return _evaluate(ast.parse(expression, mode="eval"))
@@ -17,6 +17,8 @@ from google.protobuf.json_format import ParseDict
 from kagent.core import KAgentConfig
 from kagent.openai import KAgentApp
 
+from basic_agent._calculator import evaluate_expression
+
 logger = logging.getLogger(__name__)
 
 SKILLS_DIR = Path(__file__).parent.parent / "skills"
@@ -34,14 +36,22 @@ def calculate(expression: str) -> str:
         The result of the calculation as a string
     """
     try:
-        # Safe evaluation of basic math expressions
-        # Note: In production, use a proper math expression parser
-        result = eval(expression, {"__builtins__": {}}, {})
+        result = evaluate_expression(expression)
         return f"The result of {expression} is {result}"
     except Exception as e:
         return f"Error calculating {expression}: {str(e)}"
 
 
+# Simulated weather data, keyed by casefolded city name
+_WEATHER_DATA = {
+    "san francisco": "Sunny, 68°F",
+    "new york": "Cloudy, 45°F",
+    "london": "Rainy, 52°F",
+    "tokyo": "Clear, 61°F",
+}
+_AVAILABLE_CITIES = ", ".join(_WEATHER_DATA)
+
+
 @function_tool
 def get_weather(location: str) -> str:
     """Get the current weather for a location.
@@ -52,19 +62,10 @@ def get_weather(location: str) -> str:
     Returns:
         Weather information for the location
     """
-    # Simulated weather data
-    weather_data = {
-        "san francisco": "Sunny, 68°F",
-        "new york": "Cloudy, 45°F",
-        "london": "Rainy, 52°F",
-        "tokyo": "Clear, 61°F",
-    }
-
-    location_lower = location.lower()
-    if location_lower in weather_data:
-        return f"The weather in {location} is {weather_data[location_lower]}"
-    else:
-        return f"Weather data not available for {location}. Available cities: {', '.join(weather_data.keys())}"
+    weather = _WEATHER_DATA.get(location.casefold())
+    if weather is not None:
+        return f"The weather in {location} is {weather}"
+    return f"Weather data not available for {location}. Available cities: {_AVAILABLE_CITIES}"
 
 
 tools = [calculate, get_weather]
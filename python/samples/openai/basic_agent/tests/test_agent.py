@@ -0,0 +1,37 @@
+import time
+
+import pytest
+from basic_agent._calculator import evaluate_expression
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected"),
+    [
+        ("2 + 3 * 4", 14),
+        ("(1 + 2) / 4", 0.75),
+        ("7 // 2 - 7 % 2", 2),
+        ("-2 ** 10", -1024),
+        ("2 ** 100", 2**100),
+        ("2 ** -2", 0.25),
+        ("1 ** 1000000000", 1),
+    ],
+)
+def test_calculate_arithmetic(expression, expected):
+    """Plain arithmetic on numbers is evaluated."""
+    assert evaluate_expression(expression) == expected
+
+
+@pytest.mark.parametrize("expression", ["x + 1", "abs(-1)", "__import__('os').getcwd()", "(1).real", "'a' * 3"])
+def test_calculate_rejects_names_and_calls(expression):
+    """Names, calls, attributes and non-numeric constants are rejected."""
+    with pytest.raises(ValueError, match="unsupported syntax"):
+        evaluate_expression(expression)
+
+
+@pytest.mark.parametrize("expression", ["((9 ** 999) ** 999) ** 999", "9 ** 10 ** 9", "(2 ** 9000) * (2 ** 9000)"])
+def test_calculate_rejects_huge_results(expression):
+    """Expressions whose integer result would be enormous fail fast instead of hanging."""
+    start = time.monotonic()
+    with pytest.raises(ValueError, match="result is too large"):
+        evaluate_expression(expression)
+    assert time.monotonic() - start < 1